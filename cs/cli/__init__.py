@@ -4,16 +4,13 @@
 """command line option parsing"""
 
 
+import sys
 import argparse
 import logging
 log = logging.getLogger()
 
-from . import config
-from . import help
-from . import ls
-from . import ps
 from ..logger import configure_logging
-from ..config import Config
+from ..config import COMPOSE_STACK_INFO
 from .. import version
 
 
@@ -21,39 +18,33 @@ def show_version(args, parser, cfg):
     print(f"{__name__} version {version}")
 
 
-def main():
-
-    ### global arguments
-    s = argparse.ArgumentParser(add_help=False)
-    s.add_argument("-c", "--config", dest="config_path", metavar="PATH", default=None, help=f"define main configuration file path; {config.COMPOSE_STACK_INFO}")
-    s.add_argument('-v', '--verbose', action='count', default=0, help="enable verbose mode and show warning/info/debug logs")
-    p = argparse.ArgumentParser(description="docker compose & other service stack manager", parents=[s])
-    psub = p.add_subparsers(dest='command', title="commands", metavar="COMMAND", required=True)
-    
-    # command: version
-    q = psub.add_parser("version", aliases=["--version", "-V"], help="show version")
+def add_version(q):
     q.set_defaults(func=show_version)
 
-    # command: help
-    q = psub.add_parser("help", help="show help")
-    q.set_defaults(func=help.command)
 
-    # command: config
-    q = psub.add_parser("config", parents=[s], help="parse and display configuration collated from --config PATH.")
+def add_help(q):
+    from . import help as _help
+    q.set_defaults(func=_help.command)
+
+
+def add_config(q):
+    from . import config as _config
     q.add_argument("-t", "--template", action="store_true", help="print a template")
     #q.add_argument("mode", default="yaml", nargs="?", help="output mode; supported: yaml")
     # -s, --summarize: count items
     # --check: check if items are available -> check?
-    q.set_defaults(func=config.command)
-    
-    # command: ls
-    q = psub.add_parser("ls", parents=[s], help="list inventory")
+    q.set_defaults(func=_config.command)
+
+
+def add_ls(q):
+    from . import ls as _ls
     q.add_argument('-x', '--extend', action='store_true', help="display full repo name.")
     q.add_argument('-u', '--unknown', action='store_true', help="show unknown (unnamed) docker images.")
-    q.set_defaults(func=ls.command)
-    
-    # command: ps
-    q = psub.add_parser("services", parents=[s], aliases=["ps"], help="list services and processes")
+    q.set_defaults(func=_ls.command)
+
+
+def add_ps(q):
+    from . import ps as _ps
     #          extend view
     q.add_argument('-i', '--ids', action="store_true", help="show also container IDs.")
     q.add_argument('-n', '--network', action='store_true', help="display more network details.")
@@ -68,21 +59,95 @@ def main():
     #q.add_argument('-I', '--only-ids', action="store_true", help="only list docker container IDs.")
     q.add_argument("name", nargs="?", help="detailled view on a single service.")
     #q.add_argument("-S", "--stack", default=None, help="name of stack to select service for single view.")
-    q.set_defaults(func=ps.command)
+    q.set_defaults(func=_ps.command)
+
+
+# # command: check ("run system check and print output")
+# def add_check(q):
+#     q.add_argument("mode", default="yaml", nargs="?", help="output mode; supported: yaml")
+#     q.add_argument('-v', '--verbose', action='count', default=0, help="Enable verbose mode and show warning/info/debug logs. More times used, more verbose.")
+#     q.set_defaults(func=check.command)
+
+# # command: complete ("generate shell completion output.")
+# def add_complete(q):
+#     q.add_argument("words", nargs="*", help="specify the chain of arguments to identify possible completions.")
+#     q.set_defaults(func=complete.command)
+
+
+# commands in order of appearance in the help message;
+# `parents` marks commands accepting the global arguments
+COMMANDS = {
+    "version": dict(aliases=["--version", "-V"], help="show version", add=add_version),
+    "help": dict(help="show help", add=add_help),
+    "config": dict(parents=True, help="parse and display configuration collated from --config PATH.", add=add_config),
+    "ls": dict(parents=True, help="list inventory", add=add_ls),
+    "services": dict(aliases=["ps"], parents=True, help="list services and processes", add=add_ps),
+}
+
+
+def _sniff_subcommand(argv):
+    """Return the command name given in `argv`.
+
+    Global options (`-c PATH`, `-v`) are skipped; the first other token is returned.
+    Returns `None` if no such token was found.
+    """
+    aliases = {alias for name, command in COMMANDS.items() for alias in [name, *command.get("aliases", [])]}
+    argv = iter(argv)
+    for arg in argv:
+        if arg in aliases:
+            return arg
+        if arg.startswith("--"):
+            # long options may be abbreviated
+            if len(arg) > 2 and "--config".startswith(arg):
+                next(argv, None)
+            continue
+        if arg.startswith("-"):
+            # short options may be combined, `c` takes the rest or the next token as value
+            if arg.endswith("c") and "c" not in arg[1:-1]:
+                next(argv, None)
+            continue
+        return arg
+    return None
+
+
+def _parser(sniffed):
+    """Create the argument parser.
+
+    Only the parser of the `sniffed` command is built with its arguments;
+    all other commands are placeholders listed in help and usage messages.
+    """
+
+    ### global arguments
+    s = argparse.ArgumentParser(add_help=False)
+    s.add_argument("-c", "--config", dest="config_path", metavar="PATH", default=None, help=f"define main configuration file path; {COMPOSE_STACK_INFO}")
+    s.add_argument('-v', '--verbose', action='count', default=0, help="enable verbose mode and show warning/info/debug logs")
+    p = argparse.ArgumentParser(description="docker compose & other service stack manager", parents=[s])
+    psub = p.add_subparsers(dest='command', title="commands", metavar="COMMAND", required=True)
+
+    ### commands
+    for name, command in COMMANDS.items():
+        aliases = command.get("aliases", [])
+        if sniffed not in [name, *aliases]:
+            psub.add_parser(name, aliases=aliases, help=command["help"], add_help=False)
+            continue
+        parents = [s] if command.get("parents") else []
+        q = psub.add_parser(name, aliases=aliases, parents=parents, help=command["help"])
+        command["add"](q)
+    return p
+
+
+def main():
+
+    p = _parser(_sniff_subcommand(sys.argv[1:]))
 
-    # # command: check
-    # q = psub.add_parser("check", help="run system check and print output")
-    # q.add_argument("mode", default="yaml", nargs="?", help="output mode; supported: yaml")
-    # q.add_argument('-v', '--verbose', action='count', default=0, help="Enable verbose mode and show warning/info/debug logs. More times used, more verbose.")
-    # q.set_defaults(func=check.command)
-    
-    # command: complete
-    # q = psub.add_parser("complete", help="generate shell completion output.")
-    # q.add_argument("words", nargs="*", help="specify the chain of arguments to identify possible completions.")
-    # q.set_defaults(func=complete.command)
-    
     # Parse arguments and config
-    a = p.parse_args()
+    a, unknown = p.parse_known_args()
+    if "func" not in a:
+        # the command was not sniffed, parse again with its parser built
+        p = _parser(a.command)
+        a, unknown = p.parse_known_args()
+    if unknown:
+        p.error(f"unrecognized arguments: {' '.join(unknown)}")
     
     # Configure logging
     verbose = getattr(a, "verbose", 0)
@@ -95,8 +160,11 @@ def main():
         level = logging.DEBUG
     configure_logging(level)
         
-    # Load configuration
-    c = Config(a.config_path)
+    # Load configuration, unless the command does not use it
+    c = None
+    if a.command not in ("version", "--version", "-V", "help"):
+        from ..config import Config
+        c = Config(a.config_path)
 
     # Trigger command process
     a.func(a, p, c)
@@ -8,6 +8,7 @@ DOCKER
 """
 
 
+import concurrent.futures
 import logging
 log = logging.getLogger()
 
@@ -17,8 +18,10 @@ from .. import io
 
 def command(args, parser, cfg):
     print("# DOCKER IMAGES")
-    images = system.get_docker_images()
-    io.print_table(images, output_columns=["ID", "TAG", "VERSION", "CREATED"])
-    volumes = system.get_docker_volumes()
-    io.print_table(volumes, output_columns=["ID", "CREATED", "MOUNT_PATH"])
+    # list volumes while images are listed
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        volumes = executor.submit(system.get_docker_volumes)
+        images = system.get_docker_images()
+        io.print_table(images, output_columns=["ID", "TAG", "VERSION", "CREATED"])
+        io.print_table(volumes.result(), output_columns=["ID", "CREATED", "MOUNT_PATH"])
     pass
\ No newline at end of file
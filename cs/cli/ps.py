@@ -17,11 +17,6 @@ from .. import io
 from .. import system
 from .. import service
 
-def replace_list(obj, old_value, new_value):
-    if not isinstance(obj, list):
-        return obj
-    return [new_value if x == old_value else x for x in obj]
-
 def command(args, parser, cfg):
     # load stack
     stack = service.Stack()
@@ -53,7 +48,8 @@ def command(args, parser, cfg):
     #     cols += ["CPU", "MEM"]
     if args.network or args.all:
         cols += ["NETMODE"]
-        cols = replace_list(cols, "NETPORT", "NETMAP")
+        if "NETPORT" in cols:
+            cols[cols.index("NETPORT")] = "NETMAP"
     if args.times or args.all:
         cols += ["FINISHED", "CHANGED"]
     # if args.all:
@@ -63,8 +59,7 @@ def command(args, parser, cfg):
     
 
     # load data
-    stack.load_dockerd()
-    stack.load_systemd(filter=cfg)
+    stack.load_services(filter=cfg)
 
     # print output
     io.print_table(stack.table(), output_columns=cols)
\ No newline at end of file
@@ -4,9 +4,7 @@
 """Compose stack configuration file parser"""
 
 
-import re
 import os
-import yaml
 import logging
 log = logging.getLogger()
 
@@ -23,6 +21,8 @@ Detection of config file path:
 3. use default path {COMPOSE_STACK_CONFIG}
 """
 
+SERVICE_SUFFIX = ".service"
+
 class Config(object):
 
     """Compose stack configuration parser"""
@@ -37,11 +37,27 @@ class Config(object):
         if not os.path.exists(path):
             raise ValueError(f"Cannot find configuration file '{path}'.")
         self.path = path
+        self._text = None
+        # content is shared while neither the file nor its includes are modified
         self.config = io.read_yaml(path)
         log.debug(f"loaded config from path {self.path}")
 
+    @staticmethod
+    def invalidate(path=None):
+        """Drop cached content of a configuration file, or of all files if `path` is `None`."""
+        if path is not None:
+            path = os.path.abspath(os.path.expanduser(path))
+        io.clear_yaml_cache(path)
+
     def __str__(self):
-        return yaml.dump(self.config)
+        if self._text is None:
+            import yaml
+            try:
+                from yaml import CSafeDumper as SafeDumper
+            except ImportError:
+                from yaml import SafeDumper
+            self._text = yaml.dump(self.config, Dumper=SafeDumper)
+        return self._text
 
     def get_root_path(self):
         return os.path.dirname(self.path)
@@ -59,9 +75,9 @@ class Config(object):
             return
         path = compose.get("path", None)
         if path is None:
-            root = self.get_root_path()
-            path = os.pathsep.join([root, "services", name, "compose.yml"])
-        path = os.path.abspath(path)
+            path = os.path.join(self.get_root_path(), "services", name, "compose.yml")
+        else:
+            path = os.path.abspath(path)
         if not os.path.exists(path):
             console.flush(f"error: cannot find compose path '{path}'")
             return None
@@ -99,7 +115,6 @@ class Config(object):
         return packages
 
     def get_systemd_units(self):
-        units = []
-        for service in self.config.get("services", {}).get("systemd", {}):
-            units.append(re.sub(r"\.service$", "", service))
-        return units
\ No newline at end of file
+        n = len(SERVICE_SUFFIX)
+        services = self.config.get("services", {}).get("systemd", {})
+        return [s[:-n] if s.endswith(SERVICE_SUFFIX) else s for s in services]
\ No newline at end of file
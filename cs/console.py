@@ -98,14 +98,12 @@ def clear_line():
 
 def clear_lines(n=1):
     """erase n entire lines"""
-    for i in range(n):
-        move_up()
-        clear_line()
-    move_left()
+    sys.stdout.write("\033[1A\033[2K" * n + "\033[1G")
 
 
 def replace_lines(lines=[""]):
     """erase and replace lines"""
     n = len(lines)
-    clear_lines(n)
-    flush(lines)
+    text = "".join(str(line).rstrip() + os.linesep for line in lines)
+    sys.stdout.write("\033[1A\033[2K" * n + "\033[1G" + text)
+    sys.stdout.flush()
@@ -19,7 +19,7 @@ import os
 import sys
 import csv
 import json
-import yaml
+import functools
 import logging
 log = logging.getLogger()
 
@@ -43,10 +43,8 @@ def read_txt(path, *args, **kwargs):
         str: The text (or bytestring, depending on the mode selected)
             from the selected file.
     """
-    fs = open(path, *args, **kwargs)
-    text = fs.read()
-    fs.close()
-    return text
+    with open(path, *args, **kwargs) as fs:
+        return fs.read()
 
 
 def read_lines(path, strip = os.linesep, *args, **kwargs):
@@ -58,15 +56,15 @@ def read_lines(path, strip = os.linesep, *args, **kwargs):
         path (str): File path.
         strip (str): Characters to strip from the end
             of each line. `None` to skip stripping.
+            By default, line breaks are removed.
         args, kwargs: Any other argument passed to `open`,
             such as mode, encoding, etc.
 
     Returns:
         list: Lines read from the file as a list of strings.
     """
-    fs = open(path, *args, **kwargs)
-    lines = fs.readlines()
-    fs.close()
+    with open(path, *args, **kwargs) as fs:
+        lines = fs.readlines()
     if strip is not None:
         lines = [line.rstrip(strip) for line in lines]
     return lines
@@ -83,10 +81,78 @@ def read_json(path):
     Returns:
         dict: Content of a JSON file parsed as dictionary.
     """
-    fs = open(path, "r")
-    d = json.load(fs)
-    fs.close()
-    return d
+    with open(path, "r") as fs:
+        return json.load(fs)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """Return the safe yaml loader extended with an `!include` constructor."""
+    # prefer the libyaml based loader if available
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    # safe yaml loader extended with '!include' function
+    class SafeIncluder(SafeLoader):
+        def __init__(self, stream):
+            super().__init__(stream)
+            self.root = os.path.dirname(stream.name)
+            # modification stamps of included files
+            self.stamps = []
+        def include(self, node):
+            filename = os.path.join(self.root, node.value)
+            content, stamps = _load_yaml(filename)
+            self.stamps.extend(stamps)
+            return content
+    SafeIncluder.add_constructor('!include', SafeIncluder.include)
+    return SafeIncluder
+
+
+# parsed YAML content and modification stamps by file path
+_YAML_CACHE = {}
+_YAML_CACHE_SIZE = 64
+
+
+def _is_unmodified(stamps):
+    """Return `True` if all files still have the modification times of their stamps."""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in stamps)
+    except OSError:
+        return False
+
+
+def _load_yaml(path):
+    """Parse a YAML file, reusing the result while the file is unmodified.
+
+    Returns the content and the stamps `(path, mtime_ns)` of the file
+    and of all files it `!include`s, which are checked for modifications.
+    """
+    path = os.path.abspath(path)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and _is_unmodified(cached[1]):
+        return cached
+    stamps = [(path, os.stat(path).st_mtime_ns)]
+    with open(path, "r") as fs:
+        loader = _yaml_loader()(fs)
+        try:
+            content = loader.get_single_data()
+        finally:
+            loader.dispose()
+    stamps.extend(loader.stamps)
+    _YAML_CACHE.pop(path, None)
+    if len(_YAML_CACHE) >= _YAML_CACHE_SIZE:
+        del _YAML_CACHE[next(iter(_YAML_CACHE))]
+    _YAML_CACHE[path] = (content, stamps)
+    return content, stamps
+
+
+def clear_yaml_cache(path=None):
+    """Drop cached content of a YAML file, or of all files if `path` is `None`."""
+    if path is None:
+        _YAML_CACHE.clear()
+        return
+    _YAML_CACHE.pop(os.path.abspath(path), None)
 
 
 def read_yaml(path):
@@ -96,6 +162,9 @@ def read_yaml(path):
     Supports usage of `!include`d files.
     Supports logging (see :py:mod:`cs`).
 
+    Parsed content is cached until the file or any file it includes is modified,
+    thus the returned dictionary is shared between calls and shall not be modified.
+
     Args:
         path (str): File path.
 
@@ -109,13 +178,7 @@ def read_yaml(path):
         import cs
         print(cs.io.read_yaml("tests/example.yml"))
     """
-    # safe yaml loader extended with '!include' function
-    class SafeIncluder(yaml.SafeLoader):
-        def include(self, node):
-            filename = os.path.join(os.path.dirname(self.stream.name), node.value)
-            with open(filename, 'r') as f:
-                return yaml.load(f, SafeIncluder)
-    SafeIncluder.add_constructor('!include', SafeIncluder.include)
+    import yaml
     # default to empty content
     d = {}
     # check file location
@@ -123,12 +186,11 @@ def read_yaml(path):
         logging.error("missing YAML file at {}".format(path))
         return d
     # parse file
-    with open(path, "r") as fs:
-        try:
-            logging.info("parsing YAML from file {}".format(path))
-            d = yaml.load(fs, Loader=SafeIncluder)
-        except yaml.YAMLError as e:
-            logging.error("failed importing {} YAML {}".format(path, e))
+    try:
+        logging.info("parsing YAML from file {}".format(path))
+        d = _load_yaml(path)[0]
+    except yaml.YAMLError as e:
+        logging.error("failed importing {} YAML {}".format(path, e))
     # return
     logging.debug("parsed YAML content as {}".format(d))
     return d
@@ -147,9 +209,8 @@ def write_txt(text, path):
         text (str): Text to write to a file at `path`.
         path (str): File path.
     """
-    fs = open(path, "w")
-    fs.write(text)
-    fs.close()
+    with open(path, "w") as fs:
+        fs.write(text)
     return
 
 
@@ -201,9 +262,8 @@ def write_json(path, obj, default = repr):
     
     See https://docs.python.org/3/library/json.html#json.dump
     """
-    fs = open(path, "w")
-    fs.write(json.dumps(obj, default = default))
-    fs.close()
+    with open(path, "w") as fs:
+        fs.write(json.dumps(obj, default = default))
 
 
 ### console output
@@ -221,38 +281,39 @@ def print_error(msg):
     console.flush(f"{console.Color.red}error{console.Color.none}: {msg}")
 
 
+def _format_cell(value, na, lsep, cellwidth):
+    """Format a table cell as text: replace missing values, join lists and shorten long text."""
+    if value is None and na is not None:
+        return na
+    if lsep is not None and isinstance(value, list):
+        value = lsep.join(value)
+    text = str(value)
+    if cellwidth is not None and len(text) > cellwidth:
+        return f"{text[:(cellwidth-3)]}..."
+    return text
+
+
 def print_table(rows, delimiter='\t', output=sys.stdout, output_align=True, output_columns=None, na="", lsep=", ", cellwidth=44):
     if not rows:
         return  # Handle empty input gracefully
-    def short(txt, nmax=30):
-        if txt is None:
-            return None
-        stxt = str(txt)
-        if len(stxt) > nmax:
-            return f"{stxt[:(nmax-3)]}..."
-        return txt
-    for i in range(len(rows)):
-        for key, value in rows[i].items():
-            if na is not None and value is None:
-                rows[i][key] = na
-            if lsep is not None and isinstance(value, list):
-                rows[i][key] = lsep.join(rows[i][key])
-            if cellwidth is not None:
-                rows[i][key] = short(rows[i][key], cellwidth)
-    fieldnames = output_columns if output_columns else {key for row in rows for key in row.keys()}
+    fieldnames = output_columns if output_columns else list({key for row in rows for key in row.keys()})
+    matrix = [[_format_cell(row.get(col, ''), na, lsep, cellwidth) for col in fieldnames] for row in rows]
     if output_align:
         log.debug("using manual alignment to render output")
-        col_widths = {col: max(len(col), *(len(str(row.get(col, ''))) for row in rows)) for col in fieldnames}
-        header = "  ".join(col.ljust(col_widths[col]) for col in fieldnames)
-        print(header, file=output)
-        for row in rows:
-            row_str = "  ".join(str(row.get(col, '')).ljust(col_widths[col]) for col in fieldnames)
-            print(row_str, file=output)
+        widths = [len(col) for col in fieldnames]
+        for cells in matrix:
+            for i, cell in enumerate(cells):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+        lines = ["  ".join(col.ljust(widths[i]) for i, col in enumerate(fieldnames))]
+        lines.extend("  ".join(cell.ljust(widths[i]) for i, cell in enumerate(cells)) for cells in matrix)
+        output.write("\n".join(lines))
+        output.write("\n")
     else:
         log.debug("using csv to render output")
-        writer = csv.DictWriter(output, fieldnames=fieldnames, delimiter=delimiter, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(output, delimiter=delimiter)
+        writer.writerow(fieldnames)
+        writer.writerows(matrix)
 
 
 def print_obj(obj):
@@ -36,9 +36,16 @@ FORMATS = {
     logging.DEBUG:  fmtx 
 }
 
-FORMATTERS = {
-    level: logging.Formatter(format, datefmt="%Y-%m-%d %H:%M:%S") for level, format in FORMATS.items()
-}
+
+def _formatter(level):
+    """Create a formatter with the emoji and color of a level filled in."""
+    format = FORMATS.get(level, FORMATS["default"])
+    format = format.replace("%(emoji)s", EMOJIS.get(level, ""))
+    format = format.replace("%(color)s", COLORS.get(level, ""))
+    return logging.Formatter(format, datefmt="%Y-%m-%d %H:%M:%S")
+
+# formatters by level, created on first use
+FORMATTERS = {}
 
 class EmojiFormatter(logging.Formatter):
     """Define a log format using emojis."""
@@ -47,12 +54,9 @@ class EmojiFormatter(logging.Formatter):
         super().__init__()        
 
     def format(self, record):
-        emoji = EMOJIS.get(record.levelno, "")
-        color = COLORS.get(record.levelno, "")
-        formatter = FORMATTERS.get(record.levelno, FORMATTERS["default"])
-        record.emoji = emoji
-        record.color = color
-        #record.filename = "x"
+        formatter = FORMATTERS.get(record.levelno)
+        if formatter is None:
+            formatter = FORMATTERS[record.levelno] = _formatter(record.levelno)
         return formatter.format(record)
 
 
@@ -66,7 +70,7 @@ def configure_logging(level=logging.INFO, out=sys.stderr):
     logger = logging.getLogger()
     logger.setLevel(level)
     # clear existing handlers
-    if logger.hasHandlers():
+    if logger.handlers:
         logger.handlers.clear()
     # create a stream handler
     handler = logging.StreamHandler(out)
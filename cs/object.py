@@ -4,9 +4,16 @@
 """Python object modulator."""
 
 
+import os
+import json
 import logging
 log = logging.getLogger()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Parsable(object):
     """A class where slots are parsable.
@@ -66,16 +73,16 @@ class Parsable(object):
         """
         if name is None:
             name = "miscset.io.Parsable"
-        txt = "<{}:".format(name)
+        txt = f"<{name}:"
         for var in vars(self):
             if not private and var.startswith("_"):
                 continue
             value = getattr(self, var)
-            if type(value) == type([]):
+            if isinstance(value, list):
                 value = [ str(i) for i in value ]
-            if type(value) == type({}):
+            elif isinstance(value, dict):
                 value = { k: str(v) for k,v in value.items() }
-            txt += "{}{}={}".format(sep, var, value)
+            txt += f"{sep}{var}={value}"
         txt += ">"
         return txt
 
@@ -93,10 +100,24 @@ class Parsable(object):
     def get_json(self):
         """"Return values of the data slots as a json string.
 
+        Uses `orjson` if installed.
+
         Returns:
             str: A JSON formatted string.
         """
-        return json.dumps(self.get_dict())
+        if orjson is not None:
+            return self.get_json_bytes().decode()
+        return json.dumps(self.get_dict(), separators=(",", ":"))
+
+    def get_json_bytes(self):
+        """Return values of the data slots as UTF-8 encoded json.
+
+        Returns:
+            bytes: A JSON formatted byte string.
+        """
+        if orjson is not None:
+            return orjson.dumps(self.get_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return self.get_json().encode()
 
     def get_yaml(self):
         """"Return values of the data slots as a yaml string.
@@ -104,7 +125,35 @@ class Parsable(object):
         Returns:
             str: A YAML formatted string.
         """
-        return yaml.dump(self.get_dict())
+        import yaml
+        try:
+            from yaml import CDumper as Dumper
+        except ImportError:
+            from yaml import Dumper
+        return yaml.dump(self.get_dict(), Dumper = Dumper)
+
+    def get_msgpack(self):
+        """Return values of the data slots as MessagePack bytes.
+
+        Requires the `msgpack` package.
+
+        Returns:
+            bytes: A MessagePack encoded byte string.
+        """
+        import msgpack
+        return msgpack.packb(self.get_dict(), use_bin_type = True)
+
+    def import_msgpack(self, blob, add = False):
+        """Import MessagePack bytes into data slots.
+
+        Requires the `msgpack` package.
+
+        Args:
+            blob (bytes): A MessagePack encoded dictionary.
+            add (bool): See :meth:`import_dict`.
+        """
+        import msgpack
+        self.import_dict(msgpack.unpackb(blob, raw = False), add = add)
 
     def import_dict(self, obj, add = False):
         """Import a dictionary into data slots.
@@ -122,7 +171,7 @@ class Parsable(object):
             return
         if not callable(getattr(obj, "keys", None)):
             return
-        varnames = [key for key, value in vars(self).items()]
+        varnames = vars(self)
         #obj = { key: obj.get(key) for key in obj.keys() if key in varnames }
         for key, value in obj.items():
             if key not in varnames and not add:
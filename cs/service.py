@@ -7,7 +7,9 @@
 import re
 import os
 import sys
-import datetime
+import operator
+import bisect
+import concurrent.futures
 import logging
 log = logging.getLogger()
 
@@ -17,8 +19,181 @@ from . import sh
 from . import config
 
 
+_RE_BIND_ALL = re.compile(r"^0\.0\.0\.0:")
+_RE_AFTER_COLON = re.compile(r":.*")
+# systemd timestamp, e.g. "Mon 2024-01-02 10:00:00 UTC"
+_RE_SYSTEMD_TIME = re.compile(r"\w+ (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+
+# properties read from `systemctl show`
+SYSTEMCTL_PROPERTIES = [
+    "Id", "LoadState", "FreezerState", "ActiveState", "SubState", "ExecMainPID",
+    "ExecMainStartTimestamp", "StateChangeTimestamp", "MemoryCurrent", "CPUUsageNSec",
+]
+
+
+def _parse_systemctl_show(lines):
+    """Parse `systemctl show` output into a dictionary of properties per unit.
+
+    Properties of multiple units are separated by empty lines.
+    """
+    units = []
+    u = {}
+    for line in lines:
+        if not line:
+            if u:
+                units.append(u)
+                u = {}
+            continue
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        u[key] = value
+    if u:
+        units.append(u)
+    return units
+
+
+def _systemd_state(u):
+    """Return a single state of a systemd unit from its load, freezer, active and sub states."""
+    load = u.get("LoadState", None)
+    freeze = u.get("FreezerState", None)
+    active = u.get("ActiveState", None)
+    sub = u.get("SubState", None)
+    if not load:
+        return None
+    if load != "loaded":
+        return load
+    if not freeze:
+        return None
+    if freeze != "running":
+        return freeze
+    if not active:
+        return None
+    if active in ["inactive", "failed"]:
+        return active
+    if not sub:
+        return None
+    if sub == "exited":
+        return "finished"
+    return sub
+
+
+def _fmt_systemd_time(t):
+    """Www YYYY-MM-DD HH:MM:SS TZ to YYYY-MM-DD HH:MM:SS"""
+    if not t:
+        return None
+    m = _RE_SYSTEMD_TIME.match(t)
+    return m.group(1) if m else None
+
+
+def _fmt_docker_time(dt):
+    """YYYY-MM-DDTHH:MM:SS.NNNNNNNZ to YYYY-MM-DD HH:MM:SS"""
+    if dt is None:
+        return ""
+    return dt[:19].replace("T", " ")
+
+
+def _fmt_mem(value):
+    """Format a number of bytes as gigabytes with one decimal, e.g. `1.5G`.
+
+    Returns `None` if missing, zero, not a number or systemd's unset value (2^64-1).
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    if value >= 0xFFFFFFFFFFFFFFFF:
+        return None
+    # tenths of gigabytes, rounded
+    gb10 = (value * 10 + (1 << 29)) >> 30
+    if not gb10:
+        return None
+    return f"{gb10 // 10}.{gb10 % 10}G"
+
+
+def _fmt_cpu(nanoseconds):
+    """Format a number of nanoseconds as hours, minutes and seconds, e.g. `1h 2m 3.4s`."""
+    if not nanoseconds:
+        return None
+    result = []
+    try:
+        total_seconds = int(nanoseconds) / 1e9
+        hours = int(total_seconds // 3600)
+        minutes = int((total_seconds % 3600) // 60)
+        seconds = round((total_seconds % 60), 1)
+        if hours > 0:
+            result.append(f"{hours}h")
+        if minutes > 0:
+            result.append(f"{minutes}m")
+        if seconds > 0 or not result:
+            result.append(f"{seconds}s")
+    except ValueError:
+        pass
+    if not result:
+        return None
+    return " ".join(result)
+
+
+def _fmt_mounts(mounts):
+    """Count volume and bind mounts, e.g. `2V 1B`."""
+    nv = 0
+    nb = 0
+    for mount in mounts:
+        mtype = mount.get("Type", None)
+        nb += int(mtype == "bind")
+        nv += int(mtype == "volume")
+    nv = f"{nv}V " if nv else ""
+    nb = f"{nb}B" if nb else ""
+    n = f"{nv}{nb}"
+    return n if n else None
+
+
+# `docker inspect` template emitting only the container fields read by a Service,
+# missing labels are emitted as empty strings
+DOCKER_INSPECT_FORMAT = (
+    '{"Id":{{json .Id}},"Name":{{json .Name}},"Created":{{json .Created}},"Image":{{json .Image}},'
+    '"State":{"Status":{{json .State.Status}},"StartedAt":{{json .State.StartedAt}},"FinishedAt":{{json .State.FinishedAt}}},'
+    '"Config":{"Image":{{json .Config.Image}},"Labels":{'
+    '"com.docker.compose.project":{{json (index .Config.Labels "com.docker.compose.project")}},'
+    '"com.docker.compose.service":{{json (index .Config.Labels "com.docker.compose.service")}},'
+    '"org.opencontainers.image.version":{{json (index .Config.Labels "org.opencontainers.image.version")}},'
+    '"org.opencontainers.image.created":{{json (index .Config.Labels "org.opencontainers.image.created")}}}},'
+    '"NetworkSettings":{"Ports":{{json .NetworkSettings.Ports}}},'
+    '"HostConfig":{"NetworkMode":{{json .HostConfig.NetworkMode}}},'
+    '"Mounts":[{{range $i, $m := .Mounts}}{{if $i}},{{end}}{"Type":{{json $m.Type}}}{{end}}]}'
+)
+
+
+def _docker_inspect_command(*cids):
+    """Return the command inspecting docker containers, one JSON object per line."""
+    return ["docker", "inspect", "--format", DOCKER_INSPECT_FORMAT, *cids]
+
+
+def _systemctl_show_command(*units):
+    """Return the command showing the relevant properties of systemd units."""
+    return ["systemctl", "show", f"--property={','.join(SYSTEMCTL_PROPERTIES)}", *units]
+
+
+def _docker_inspect(cid):
+    """Return the parsed `docker inspect` object of a container, or `None` if not found."""
+    inspect = sh.Process(_docker_inspect_command(cid))
+    return inspect.json_lines[0] if inspect.is_done else None
+
+
 class Service(object):
     """A service configuration."""
+
+    __slots__ = (
+        # identification
+        "wanted", "type", "stack", "name", "pid", "pid6",
+        # status
+        "state", "created", "started", "finished", "changed",
+        # ressources
+        "mem", "cpu", "blockio", "netio",
+        "netport", "netmap", "netmode", "mounts",
+        "image", "imageid", "imageid6", "imagever", "imagedate",
+    )
+
     def __init__(self, **kwargs):
         """Initialize a service configuration.
 
@@ -173,6 +348,7 @@ class Service(object):
                 setattr(self, key, value)
 
     def initialize(self):
+        """Reset all slots to their defaults."""
         # identification
         self.wanted = False
         self.type = None
@@ -207,10 +383,14 @@ class Service(object):
         Matches `pid` if not missing.
         Matches `stack` and `name` otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, Service):
             return False
-        if self.pid and other.pid:
-            return self.pid == other.pid
+        pid = self.pid
+        other_pid = other.pid
+        if pid and other_pid:
+            return pid == other_pid
         return self.stack == other.stack and self.name == other.name
 
     def __str__(self):
@@ -224,184 +404,96 @@ class Service(object):
     def details(self):        
         name = self.name
         stack = self.stack
-        metadata = {k:v for k,v in vars(self).items() if k not in ["name", "stack"]}
+        metadata = {k:getattr(self, k) for k in self.__slots__ if k not in ["name", "stack"]}
         data = [{"NAME": name, "STACK": stack, "PARAMETER": k, "VALUE": v} for k,v in metadata.items()]
         io.print_table(data, output_columns=["NAME", "STACK", "PARAMETER", "VALUE"])
     
     def systemctl_show(self, name):
-        """
-        """
-        # load
+        """Load a systemd unit from `systemctl show <name>`."""
+        lines = sh.Process(_systemctl_show_command(name)).lines
+        units = _parse_systemctl_show(lines)
+        return self._apply_systemctl_dict(units[0] if units else {})
+
+    def _apply_systemctl_dict(self, u):
+        """Load a systemd unit from its parsed `systemctl show` properties."""
         self.initialize()
-        vars = sh.Process(["systemctl", "show", name]).lines
-        u = {}
-        for var in vars:
-            key, value = var.split("=", 1)
-            u[key] = value
         # identification
-        self.wanted = False
         self.type = "systemd"
         self.stack = "systemd"
         self.name = u.get("Id", None)
         if self.name:
             self.name = self.name.replace(".service", "")
         self.pid = u.get("ExecMainPID", None)
-        self.pid6 = None
         # status
-        def state(u):
-            load = u.get("LoadState", None)
-            freeze = u.get("FreezerState", None)
-            active = u.get("ActiveState", None)
-            sub = u.get("SubState", None)
-            if not load:
-                return None
-            if load != "loaded":
-                return load
-            if not freeze:
-                return None
-            if freeze != "running":
-                return freeze
-            if not active:
-                return None
-            if active in ["inactive", "failed"]:
-                return active
-            if not sub:
-                return None
-            if sub == "exited":
-                return "finished"
-            return sub
-        self.state = state(u)
+        self.state = _systemd_state(u)
         self.created = None # no solution yet; check unit file creation timestamp?
-        def fmt(t):
-            log.debug(f"parsing time string: '{t}'")
-            if not t:
-                return None
-            try:
-                t = datetime.datetime.strptime(t, "%a %Y-%m-%d %H:%M:%S %Z")
-                t = t.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                return None
-            return t
-        self.started = fmt(u.get("ExecMainStartTimestamp", None))
+        self.started = _fmt_systemd_time(u.get("ExecMainStartTimestamp", None))
         self.finished = None # no solution yet
-        self.changed = fmt(u.get("StateChangeTimestamp", None))
+        self.changed = _fmt_systemd_time(u.get("StateChangeTimestamp", None))
         # ressources
-        def fmt(unit):
-            mem = None
-            try:
-                mem = round(int(unit["MEM"]) / 1024 / 1024 / 1024 * 10) / 10
-            except:
-                pass
-            return f"{mem}G" if mem else None
-        self.mem = fmt(u.get("MemoryCurrent", None))
-        def fmt(nanoseconds):
-            if not nanoseconds:
-                return None
-            result = []
-            try:
-                total_seconds = int(nanoseconds) / 1e9
-                hours = int(total_seconds // 3600)
-                minutes = int((total_seconds % 3600) // 60)
-                seconds = round((total_seconds % 60), 1)
-                if hours > 0:
-                    result.append(f"{hours}h")
-                if minutes > 0:
-                    result.append(f"{minutes}m")
-                if seconds > 0 or not result:
-                    result.append(f"{seconds}s")
-            except:
-                pass
-            if not result:
-                return None
-            return " ".join(result)
-        self.cpu = fmt(u.get("CPUUsageNSec", None))
-        self.blockio = None
-        self.netio = None
-        self.netport = []
-        self.netmap = []
-        self.netmode = None
-        self.mounts = None
-        self.image = None
-        self.imageid = None
-        self.imageid6 = None
-        self.imagever = None
-        self.imagedate = None
+        self.mem = _fmt_mem(u.get("MemoryCurrent", None))
+        self.cpu = _fmt_cpu(u.get("CPUUsageNSec", None))
+        # remaining slots keep their defaults from initialize()
         return True
 
     def docker_inspect(self, cid):
-        """
+        """Load a docker container from `docker inspect <cid>`."""
+        c = sh.Process(_docker_inspect_command(cid)).json_lines[0]
+        return self._apply_inspect_dict(c, cid)
+
+    def _apply_inspect_dict(self, c, cid=None):
+        """Load a docker container from its parsed `docker inspect` object.
+
         type criteria:
             TYPE/KEY    Image   RepoTag MountPoint
             container   yes     no      no
             image       no      yes     no
             volume      no      no      yes
         """
-        # load system info
         self.initialize()
-        c = sh.Process(["docker", "inspect", cid]).json[0]
         # check if we pass the type criteria
         if not c.get("Image", False):
             raise Exception("Cannot parse a docker item from other type than container!")
+        # subtrees, which docker may also report as null
+        conf = c.get("Config") or {}
+        labels = conf.get("Labels") or {}
+        state = c.get("State") or {}
         # identification
-        project = c.get("Config", {}).get("Labels", {}).get("com.docker.compose.project", "")
+        project = labels.get("com.docker.compose.project", "")
         self.type = "dockerd" if not project else "compose"
         self.stack = self.type if not project else project
-        self.name = c.get("Config", {}).get("Labels", {}).get("com.docker.compose.service", None)
-        if self.name is None:
+        self.name = labels.get("com.docker.compose.service", None)
+        if not self.name:
             self.name = c.get("Name", None).strip("/")
         self.pid = c.get("Id", cid)
         self.pid6 = self.pid[0:6]
         # status
         notime = "0000-00-00 00:00:00"
-        def fmt(dt):
-            """YYYY-MM-DDTHH:MM:SS.NNNNNNNZ to YYYY-MM-DD HH:MM:SS"""
-            if dt is None:
-                return ""
-            return dt[:19].replace("T", " ")
-        def newer(this, that):
-            this = datetime.datetime.strptime(this, '%Y-%m-%d %H:%M:%S')
-            that = datetime.datetime.strptime(that, '%Y-%m-%d %H:%M:%S')
-            return this > that
-        self.state = c.get("State", {}).get("Status", None)
-        self.created = fmt(c.get("Created", notime))
-        self.started = fmt(c.get("State", {}).get("StartedAt", notime))
-        self.finished = fmt(c.get("State", {}).get("FinishedAt", notime))
-        self.changed = self.created
-        if newer(self.started, self.changed):
-            self.changed = self.started
-        if newer(self.finished, self.changed):
-            self.changed = self.finished
+        self.state = state.get("Status", None)
+        self.created = _fmt_docker_time(c.get("Created", notime))
+        self.started = _fmt_docker_time(state.get("StartedAt", notime))
+        self.finished = _fmt_docker_time(state.get("FinishedAt", notime))
+        # fixed width timestamps sort chronologically as text
+        self.changed = max(self.created, self.started, self.finished)
         # ressources
         #self.mem = None
         #self.cpu = None
         #self.blockio = None
         #self.netio = None
-        self.netport = []
-        self.netmap = []
-        for cp, props in c.get("NetworkSettings", {}).get("Ports", {}).items():
+        ports = (c.get("NetworkSettings") or {}).get("Ports") or {}
+        for cp, props in ports.items():
             hp = "" if not props else props[0].get("HostPort", "")
             m = f"{hp}({cp})"
             self.netmap.append(m)
             if hp:
                 self.netport.append(hp)
-        self.netmode = c.get("HostConfig", {}).get("NetworkMode", "")
-        def mnt(mounts):
-            nv = 0
-            nb = 0
-            for mount in mounts:
-                mtype = mount.get("Type", None)
-                nb += int(mtype == "bind")
-                nv += int(mtype == "volume")
-            nv = f"{nv}V " if nv else ""
-            nb = f"{nb}B" if nb else ""
-            n = f"{nv}{nb}"
-            return n if n else None
-        self.mounts = mnt(c.get("Mounts", []))
-        self.image = c.get("Config", {}).get("Image", None)
+        self.netmode = (c.get("HostConfig") or {}).get("NetworkMode", "")
+        self.mounts = _fmt_mounts(c.get("Mounts") or [])
+        self.image = conf.get("Image", None)
         self.imageid = c.get("Image", None)
         self.imageid6 = self.imageid.replace("sha256:", "")[:6] if self.imageid else None
-        self.imagever = c.get("Config", {}).get("Labels", {}).get("org.opencontainers.image.version", "")
-        self.imagedate = c.get("Config", {}).get("Labels", {}).get("org.opencontainers.image.created", "")
+        self.imagever = labels.get("org.opencontainers.image.version", "")
+        self.imagedate = labels.get("org.opencontainers.image.created", "")
         return True
 
     def stop(self):
@@ -429,6 +521,11 @@ class Service(object):
             pass
 
 
+# table columns and a getter of the respective Service attribute values
+TABLE_COLUMNS = [key.upper() for key in Service.__slots__]
+_table_values = operator.attrgetter(*Service.__slots__)
+
+
 class Stack(object):
     """Handle a collection of Service objects."""
     def __init__(self, services=[], cfg=None):
@@ -439,14 +536,13 @@ class Stack(object):
         if isinstance(cfg, config.Config):
             f = cfg.get_systemd_units()
             f = {"Id": f} if f else f
-            self.load_dockerd()
-            self.load_systemd(filter=f)
+            self.load_services(filter=f)
 
     def __len__(self):
         return len(self.services)
 
     def __contains__(self, item):
-        return any([item == service for service in self.services])
+        return isinstance(item, Service) and self._index(item) is not None
 
     def __str__(self):
         return f"<ServiceStack with {len(self.services)} items>"
@@ -456,58 +552,125 @@ class Stack(object):
 
     def reconfigure(self):
         self.services = []
+        # indices of services by pid, by (stack, name) and by name
+        self._by_pid = {}
+        self._by_key = {}
+        self._by_name = {}
+        # `docker ps` status line and `docker inspect` object by container id
+        self._containers = {}
+
+    def _index(self, item):
+        """Return the index of the service equal to `item`, or `None`.
+
+        See :meth:`Service.__eq__` for equality.
+        """
+        pids = self._by_pid.get(item.pid) if item.pid else None
+        found = pids[0] if pids else None
+        for i in self._by_key.get((item.stack, item.name), ()):
+            if found is not None and i > found:
+                break
+            if not item.pid or not self.services[i].pid:
+                return i
+        return found
+
+    def _link(self, i):
+        """Add the service at index `i` to the indices."""
+        service = self.services[i]
+        if service.pid:
+            bisect.insort(self._by_pid.setdefault(service.pid, []), i)
+        bisect.insort(self._by_key.setdefault((service.stack, service.name), []), i)
+        bisect.insort(self._by_name.setdefault(service.name, []), i)
+
+    def _unlink(self, i):
+        """Remove the service at index `i` from the indices."""
+        service = self.services[i]
+        if service.pid:
+            self._by_pid[service.pid].remove(i)
+        self._by_key[(service.stack, service.name)].remove(i)
+        self._by_name[service.name].remove(i)
 
     def add(self, item, replace=True):
         if not isinstance(item, Service):
             return False
-        if item not in self:
+        i = self._index(item)
+        if i is None:
             self.services.append(item)
+            self._link(len(self.services) - 1)
             return True
-        for i in range(len(self)):
-            if item == self.services[i]:
-                # collect wanted state
-                wanted = item.wanted or self.services[i].wanted
-                # replace data
-                if replace:
-                    self.services[i] = item
-                # update wanted state even when not replacing
-                self.services[i].wanted = wanted
-                # exit
-                return True
-        return False
-
-    def get(self, name, default=None):
+        # collect wanted state
+        wanted = item.wanted or self.services[i].wanted
+        # replace data
+        if replace:
+            self._unlink(i)
+            self.services[i] = item
+            self._link(i)
+        # update wanted state even when not replacing
+        self.services[i].wanted = wanted
+        return True
+
+    def get(self, name, default=None, stack=None):
         """Get first service item matching a pattern."""
-        for service in self.services:
-            if service.name == name:
-                return service
-        return default
+        if stack is None:
+            indices = self._by_name.get(name)
+        else:
+            indices = self._by_key.get((stack, name))
+        return self.services[indices[0]] if indices else default
 
     def find(self, name, stack = None):
         """Return all services items matching a pattern."""
-        services = []
-        for service in self.services:
-            if service.name == name:
-                services.append(service)
-        return services
+        if stack is not None:
+            return [self.services[i] for i in self._by_key.get((stack, name), ())]
+        return [self.services[i] for i in self._by_name.get(name, ())]
 
     def load_dockerd(self, compose_file=None):
-        # retrieve ids
-        cmd = ["docker", "ps", "--all", "--format", "{{.ID}}"]
+        """Load docker containers.
+
+        Containers are only inspected if their `docker ps` state or status
+        changed since the last call on this stack.
+        """
+        # retrieve ids and status
+        fmt = "{{.ID}} {{.State}} {{.Status}}"
+        cmd = ["docker", "ps", "--all", "--format", fmt]
         if compose_file is not None:
-            cmd = ["docker", "compose", "-f", compose_file, "ps", "--all", "--format", "{{.ID}}"] 
-        ids = [i for i in sh.Process(cmd).lines if i]
-        # retrieve and add data
-        for id in ids:
+            cmd = ["docker", "compose", "-f", compose_file, "ps", "--all", "--format", fmt]
+        status = {}
+        for line in sh.Process(cmd).lines:
+            cid, _, rest = line.partition(" ")
+            if cid:
+                status[cid] = rest
+        known = self._containers
+        for cid in [cid for cid in known if cid not in status]:
+            del known[cid]
+        ids = [cid for cid in status if known.get(cid, (None,))[0] != status[cid]]
+        # retrieve changed data, inspecting all containers at once
+        if ids:
+            inspect = sh.Process(_docker_inspect_command(*ids))
+            if inspect.is_done:
+                containers = inspect.json_lines
+            else:
+                # some container vanished meanwhile, inspect one by one and skip missing ones
+                log.debug("failed inspecting all containers at once")
+                workers = min(16, len(ids))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    containers = list(executor.map(_docker_inspect, ids))
+            for cid, c in zip(ids, containers):
+                if c:
+                    known[cid] = (status[cid], c)
+                else:
+                    known.pop(cid, None)
+        # add data
+        for cid in status:
+            if cid not in known:
+                continue
             s = Service()
-            s.docker_inspect(id)
+            s._apply_inspect_dict(known[cid][1])
             self.add(s, replace=True)
 
     def load_systemd(self, filter={}):
         # retrieve unit names
         cmd = ["systemctl", "list-units", "--type=service", "--all", "--no-pager", "--plain", "--no-legend"]
         units = sh.Process(cmd).lines
-        units = [line.split(" ")[0].replace(".service", "") for line in units]
+        units = [line.split(" ")[0].replace(".service", "") for line in units if line]
         # filter
         if filter:
             if isinstance(filter, config.Config):
@@ -517,13 +680,35 @@ class Stack(object):
                     units = [id for id in units if id in filter["Id"]]
                 else:
                     units = [id for id in units if id == filter["Id"]]
-        # retrieve and add data
-        for unit in units:
+        if not units:
+            return
+        # retrieve and add data, showing all units at once
+        lines = sh.Process(_systemctl_show_command(*units)).lines
+        for u in _parse_systemctl_show(lines):
             s = Service()
-            s.systemctl_show(unit)
+            s._apply_systemctl_dict(u)
             s.wanted = filter and "Id" in filter
             self.add(s)
 
+    def load_services(self, filter={}):
+        """Load dockerd and systemd services concurrently.
+
+        Both are queried in separate threads and added in order, dockerd first.
+        The `filter` is passed to :meth:`load_systemd`.
+        """
+        dockerd = Stack()
+        dockerd._containers = self._containers
+        systemd = Stack()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            jobs = [
+                executor.submit(dockerd.load_dockerd),
+                executor.submit(systemd.load_systemd, filter=filter),
+            ]
+            for job in jobs:
+                job.result()
+        for service in dockerd.services + systemd.services:
+            self.add(service)
+
     def load_config(self, cfg):
         # systemd services
         for unit in cfg.get_systemd_units():
@@ -542,8 +727,10 @@ class Stack(object):
             compose_services = composed.get("services", {})
             for service_name, serviced in compose_services.items():
                 ports = " ".join(serviced.get('ports', []))
-                portmap = re.sub(r"^0\.0\.0\.0:", "", ports)
-                ports = re.sub(r":.*", "", portmap)
+                portmap = ports
+                if ":" in ports:
+                    portmap = _RE_BIND_ALL.sub("", ports)
+                    ports = _RE_AFTER_COLON.sub("", portmap)
                 portmap = portmap.split(":", 1)
                 if len(portmap) > 1:
                     portmap[1] = f"({portmap[1]})"
@@ -552,11 +739,7 @@ class Stack(object):
                 self.add(s)
 
     def table(self):
-        rows = [] #[ s.__dict__ for s in self.services ]
-        for s in self.services:
-            row = { key.upper(): value for key, value in s.__dict__.items() }
-            rows.append(row)
-        return rows
+        return [dict(zip(TABLE_COLUMNS, _table_values(s))) for s in self.services]
 
     def up(self):
         pass
@@ -5,11 +5,14 @@
 
 
 import os
+import sys
 import json
 import shlex
 import getpass
+import functools
 import subprocess
 import asyncio
+import collections
 import logging
 log = logging.getLogger()
 
@@ -17,6 +20,57 @@ log = logging.getLogger()
 from . import console
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_LINESEP = os.linesep
+# decoder reused for parsing JSON without `orjson`
+_JSON_DECODER = json.JSONDecoder()
+
+
+@functools.lru_cache(maxsize=1)
+def _current_user():
+    """Return the name of the user running this process.
+
+    The result is cached, call `_current_user.cache_clear()` after switching the user.
+    """
+    return getpass.getuser()
+
+
+def iter_json_lines(command):
+    """Run a command and parse its standard output from JSON line by line.
+
+    Objects are yielded as soon as their line was read,
+    without buffering the whole output.
+    Empty lines are skipped.
+    Uses `orjson` if installed.
+    """
+    loads = orjson.loads if orjson is not None else _JSON_DECODER.decode
+    log.debug(f"shell command    : {shlex.join(command)}")
+    try:
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+    except OSError as e:
+        log.debug(f"shell stderr     : {e}")
+        return
+    with proc:
+        for line in proc.stdout:
+            if line.strip():
+                yield loads(line)
+    log.debug(f"shell return code: {proc.returncode}")
+
+
+def _exec_failed(command, error):
+    """Return a failed process for the `OSError` raised executing a command.
+
+    Return codes are the ones of a shell, 127 if not found and 126 if not executable.
+    """
+    code = 127 if isinstance(error, FileNotFoundError) else 126
+    return subprocess.CompletedProcess(command, code, stdout = "", stderr = str(error))
+
+
 class Process(object):
     """Shell subprocess system.
 
@@ -25,13 +79,20 @@ class Process(object):
     """
     def __init__(self, command=None, live=0):
         """Create and execute a subprocess."""
-        if isinstance(command, str):
+        # shell text of the command, kept as given for a string
+        self._is_text = isinstance(command, str)
+        commandstr = command
+        if self._is_text:
             command = shlex.split(command)
         if not isinstance(command, list):
             raise ValueError(f"command object not of type list: '{type(command)}'")
         self.command = command
+        self._commandstr = commandstr if self._is_text else shlex.join(command)
         self.started = None
         self.obj = None
+        self._stdout_stripped = None
+        self._stderr_stripped = None
+        self._stdout_lines = []
         if command is not None:
             if live:
                 self.run_live(n_lines=live)
@@ -41,6 +102,9 @@ class Process(object):
     def _update(self, proc):
         if isinstance(proc, subprocess.CompletedProcess):
             self.obj = proc
+            self._stdout_stripped = proc.stdout.strip() if proc.stdout else None
+            self._stderr_stripped = proc.stderr.strip() if proc.stderr else None
+            self._stdout_lines = proc.stdout.strip(_LINESEP).split(_LINESEP) if proc.stdout else []
             log.debug(f"shell command    : {self.commandline}")
             log.debug(f"shell stdout     : {self.stdoutstripped}")
             log.debug(f"shell stderr     : {self.stderrstripped}")
@@ -49,7 +113,7 @@ class Process(object):
     @property
     def commandline(self):
         """Return the text line representation of the command."""
-        return " ".join(self.command)
+        return self._commandstr
 
     @property
     def is_completed(self):
@@ -80,10 +144,8 @@ class Process(object):
 
     @property
     def stdoutstripped(self):
-        """Return standard error stripped text of subprocess."""
-        if not self.stdout:
-            return None
-        return self.stdout.strip()
+        """Return standard output stripped text of subprocess."""
+        return self._stdout_stripped
 
     @property
     def stderr(self):
@@ -93,40 +155,56 @@ class Process(object):
     @property
     def stderrstripped(self):
         """Return standard error stripped text of subprocess."""
-        if not self.stderr:
-            return None
-        return self.stderr.strip()
+        return self._stderr_stripped
 
     @property
-    def lines(self, strip=True, err=False):
-        """Return stdout/stderr and parse as array of lines."""
-        lines = self.stderr if err else self.stdout
-        if strip:
-            lines = lines.strip(os.linesep)
-        return lines.split(os.linesep)
+    def lines(self):
+        """Return standard output as array of lines.
+
+        Leading and trailing line breaks are removed.
+        The list is shared, do not modify it.
+        """
+        return self._stdout_lines
 
     @property
     def json(self):
-        """Return standard output and parse from JSON to dict."""
-        return json.loads(self.stdout.strip())
+        """Return standard output and parse from JSON to dict.
+
+        Uses `orjson` if installed.
+        """
+        stdout = self._stdout_stripped or ""
+        if orjson is not None:
+            return orjson.loads(stdout)
+        return _JSON_DECODER.decode(stdout)
 
     @property
     def json_lines(self):
-        """Return standard output and parse from JSON to dict."""
-        lines = self.stdout.strip().split(os.linesep)
-        obj = [json.loads(line) for line in lines]
-        return obj
+        """Return standard output and parse each line from JSON to dict.
+
+        Uses `orjson` if installed.
+        """
+        loads = orjson.loads if orjson is not None else _JSON_DECODER.decode
+        return [loads(line) for line in self._stdout_lines]
 
     def run(self):
-        """Run a command locally."""
-        proc = subprocess.run(
-            " ".join(self.command),
-            input = None,
-            text = True,
-            universal_newlines = True,
-            capture_output = True,
-            bufsize = 0,
-            shell = True)
+        """Run a command locally.
+
+        The command is executed directly, without a shell, so there is no shell expansion.
+        A missing executable results in return code 127 and one which cannot be executed
+        in return code 126, as a shell would report them.
+        Standard error is only captured if debug messages are logged, discarded otherwise.
+        """
+        stderr = subprocess.PIPE if log.isEnabledFor(logging.DEBUG) else subprocess.DEVNULL
+        try:
+            proc = subprocess.run(
+                self.command,
+                input = None,
+                text = True,
+                stdout = subprocess.PIPE,
+                stderr = stderr,
+                shell = False)
+        except OSError as e:
+            proc = _exec_failed(self.command, e)
         self._update(proc)
         return self.is_done
 
@@ -142,8 +220,12 @@ class Process(object):
         - supply environment paths exported in the shell prior to executing the command
         - return error code, stdout, stderr to a logger from the `logging` module as debug message
 
+        The shell receives the command text as given to :class:`Process`, so a string
+        may use shell syntax, e.g. "id -u -n; pwd", while a list is quoted argument by argument.
+        A local command given as list and run by the current user without piping
+        is executed by :meth:`run`, without a shell.
+
         Args:
-            cmd (str): A string used as shell command.
             remote (str): A name of a remote server, if given ssh is invoked.
             user (str): A user name to connect with ssh to a `remote` server or
                 switch to using sudo for localhost.
@@ -162,7 +244,7 @@ class Process(object):
                 print(miscset.sh.run("uname").stdout)
 
         """
-        cmd = self.command
+        cmd = self._commandstr
         if env is None:
             env = []
         if remote in ["localhost", "127.0.0.1"]:
@@ -174,27 +256,28 @@ class Process(object):
             else:
                 runner += [remote]
             if piped:
-                runner += ["\"bash -s\""]
+                runner += ["bash -s"]
             else:
-                runner += [f"\"{cmd}\""]
+                runner += [cmd]
             if len(env):
                 env = ":".join(env)
                 cmd = f"export PATH=\"{env}:$PATH\"; {cmd}"
-        elif user and user != getpass.getuser():
+        elif user and user != _current_user():
             runner = ["sudo", "-u", user]
             if piped:
-                runner += ["bash -s"]
+                runner += ["bash", "-s"]
             else:
-                # this case failed,
-                # since sudo would not understand the string
-                # "id -u -n; pwd"
-                # as a command unlike ssh?
-                runner += [f"\"{cmd}\""]
+                # unlike ssh, sudo does not run a command line
+                # like "id -u -n; pwd" by itself, so pass it to a shell
+                runner += ["bash", "-c", cmd]
         else:
             if piped:
-                runner = ["bash -s"]
+                runner = ["bash", "-s"]
+            elif self._is_text:
+                runner = ["bash", "-c", cmd]
             else:
-                runner = [cmd]
+                # a local command given as list needs no shell
+                return self.run()
         pipe_input = None
         if piped:
             pipe_input = cmd
@@ -203,7 +286,7 @@ class Process(object):
         log.debug(f"shell stdin is {pipe_input}")
         log.debug(f"shell runner is {runner}")
         proc = subprocess.run(
-            " ".join(runner),
+            shlex.join(runner),
             input = pipe_input,
             text = True,
             universal_newlines = True,
@@ -212,52 +295,66 @@ class Process(object):
             shell = True)
         self._update(proc)
         def prettify(std):
-            std = std.split(os.linesep)
+            std = std.split(_LINESEP)
             std = [ line for line in std if len(line) ]
             if len(std):
                 std = [""] + std
-            std = os.linesep.join(std)
+            std = _LINESEP.join(std)
             return std
         return self.is_done
     
     def run_live(self, n_lines=7):
-        """Run a command and live parse stdout to console."""
+        """Run a command and live parse stdout to console.
+
+        The live view is only a convenience for interactive use.
+        If stdout is not a terminal or the `CI` environment variable is set,
+        the command is executed by :meth:`run` instead.
+        """
+        if os.environ.get("CI") or not sys.stdout.isatty():
+            return self.run()
+        # helper to read
+        async def read_live(stream, out_lines):
+            """Read the stream in chunks and collect its lines."""
+            # incomplete last line of the chunks read so far
+            rest = b""
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    break
+                *lines, rest = (rest + chunk).split(b"\n")
+                out_lines.extend(line.decode().rstrip() for line in lines)
+            if rest:
+                out_lines.append(rest.decode().rstrip())
         # helper to parse
         async def parse_live(proc, n_lines):
-            """Parse the stdout live to console."""
+            """Parse the stdout live to console, redrawing at most once per delay."""
             prefix=f"{console.Color.dim}>> "
             delay_seconds = 1
-            previous_out_line = None
-            out_lines = []
+            shown_lines = []
+            # keep only the last lines, which are displayed
+            out_lines = collections.deque(maxlen=n_lines)
             console.flush([prefix] * n_lines)
-            while True:
-                i = 0
-                start_time = asyncio.get_event_loop().time()
-                while (asyncio.get_event_loop().time() - start_time) < delay_seconds:
-                    out_line = await proc.stdout.readline()
-                    #err_line = await proc.stderr.readline()
-                    if not out_line:# and not err_line:
-                        break
-                    i += 1
-                    out_lines.append(out_line.decode().rstrip())
-                    #out_line = f"{prefix}{out_line.decode().rstrip()}"
-                if previous_out_line != out_line:
-                    previous_out_line = out_line
-                    print_lines = [""] * n_lines
-                    last_lines = out_lines[-n_lines:]
-                    print_lines[-len(last_lines):] = last_lines
-                    k=len(print_lines)
+            reader = asyncio.create_task(read_live(proc.stdout, out_lines))
+            while not reader.done():
+                await asyncio.wait([reader], timeout=delay_seconds)
+                last_lines = list(out_lines)
+                if shown_lines != last_lines:
+                    shown_lines = last_lines
+                    print_lines = [""] * (n_lines - len(last_lines)) + last_lines
                     console.replace_lines([f"{prefix}{line}{console.Color.none}" for line in print_lines])
-                if i == 0:
-                    break
+            await reader
             console.clear_lines(n_lines)
         # helper to schedule parser
         async def schedule_live(command, n_lines):
             pipe = asyncio.subprocess.PIPE
-            proc = await asyncio.create_subprocess_shell(command, stdout=pipe, stderr=pipe)
+            # show stderr, e.g. progress of `docker compose pull`, along with stdout
+            try:
+                proc = await asyncio.create_subprocess_exec(*command, stdout=pipe, stderr=asyncio.subprocess.STDOUT)
+            except OSError as e:
+                return _exec_failed(command, e)
             await parse_live(proc, n_lines)
             await proc.wait()
-            return proc
+            return subprocess.CompletedProcess(command, proc.returncode)
         # execute
         proc = asyncio.run(schedule_live(self.command, n_lines))
         # store
@@ -4,7 +4,7 @@
 """operating system interactions"""
 
 
-import yaml
+import functools
 import logging
 log = logging.getLogger()
 
@@ -13,19 +13,27 @@ from . import sh
 from . import dt
 
 
+@functools.lru_cache(maxsize=256)
 def which(bin):
     """Get path to file of a command.
 
     Uses system's `which` tool.
     Returns the path to the tool or `None` if not found.
+    Results are cached for the lifetime of the process.
     """
     path = sh.Process(["which", bin]).stdoutstripped
-    if not len(path):
+    if not path:
         return None
-    return path[0]
-    
+    return path
 
+
+@functools.lru_cache(maxsize=None)
 def get_os():
+    """Get the operating system id, e.g. `debian`, from `/etc/os-release`.
+
+    Returns `None` if unknown.
+    The result is cached for the lifetime of the process.
+    """
     try:
         # linux
         with open("/etc/os-release", "r") as f:
@@ -38,48 +46,50 @@ def get_os():
     return None
 
 
+def _docker_inspect(kind, ids):
+    """Return the parsed `docker <kind> inspect` objects of all `ids` at once.
+
+    Objects which vanished meanwhile are skipped.
+    """
+    ids = [id for id in ids if id]
+    if not ids:
+        return []
+    inspect = sh.Process(["docker", kind, "inspect", *ids])
+    if not inspect.stdoutstripped:
+        return []
+    return inspect.json
+
+
+def _extract_entry(id, image):
+    """Return the table entry of an inspected docker container or image."""
+    tags = image.get("RepoTags") or [""]
+    labels = (image.get("Config") or {}).get("Labels")
+    return {
+        "ID": id,
+        "TAG": tags[0],
+        "CREATED": dt.simplify_systemd(image.get("Created", "")),
+        "VERSION": None if labels is None else labels.get("org.opencontainers.image.version", ""),
+    }
+
+
 def get_docker_containers():
     cmd = ["docker", "ps", "-a", "--format", "{{.ID}}"]
     ids = sh.Process(cmd).lines
-    containers = []
-    for id in ids:
-        image = sh.Process(["docker", "inspect", id]).json[0]
-        tag = image.get("RepoTags", [])
-        conf = image.get("Config", {})
-        conf_labs = conf.get("Labels", {})
-        entry = {}
-        entry["ID"] = id
-        entry["TAG"] = "" if not len(tag) else tag[0]
-        entry["CREATED"] = f"{dt.simplify_systemd(image.get('Created', ''))}"
-        entry["VERSION"] = None if conf_labs is None else conf_labs.get("org.opencontainers.image.version", "")
-        containers.append(entry)
-    return containers
+    return [_extract_entry(c.get("Id", "")[:12], c) for c in _docker_inspect("container", ids)]
 
 
 def get_docker_images():
     cmd = ["docker", "images", "--format", "{{.ID}}"]
     ids = sh.Process(cmd).lines
-    images = []
-    for id in ids:
-        image = sh.Process(["docker", "inspect", id]).json[0]
-        tag = image.get("RepoTags", [])
-        conf = image.get("Config", {})
-        conf_labs = conf.get("Labels", {})
-        entry = {}
-        entry["ID"] = id
-        entry["TAG"] = "" if not len(tag) else tag[0]
-        entry["CREATED"] = f"{dt.simplify_systemd(image.get('Created', ''))}"
-        entry["VERSION"] = None if conf_labs is None else conf_labs.get("org.opencontainers.image.version", "")
-        images.append(entry)
-    return images
+    return [_extract_entry(i.get("Id", "").replace("sha256:", "")[:12], i) for i in _docker_inspect("image", ids)]
 
 
 def get_docker_volumes():
     cmd = ["docker", "volume", "ls", "-q"]
     ids = sh.Process(cmd).lines
     volumes = []
-    for id in ids:
-        volume = sh.Process(["docker", "inspect", id]).json[0]
+    for volume in _docker_inspect("volume", ids):
+        id = volume.get("Name", None)
         log.debug(f"volume={volume}")
         labels = volume.get("Labels", {})
         if labels is None:
@@ -102,9 +112,8 @@ def get_docker_volumes():
 
 def get_dockerd_stats():
     cmd = ["docker", "stats", "--no-stream", "--format", "json"]
-    stats = sh.Process(cmd).json_lines
     services = []
-    for s in stats:
+    for s in sh.iter_json_lines(cmd):
         entry = {}
         entry["CONTAINER.ID"] = s.get("ID", None)
         if entry["CONTAINER.ID"] is None:
@@ -113,13 +122,11 @@ def get_dockerd_stats():
         entry["CPU"] = s.get("CPUPerc", "")
         entry["IO.BLK"] = s.get("BlockIO", "")
         entry["IO.NET"] = s.get("NetIO", "")
+        services.append(entry)
     return services
 
 
 def get_dockerd_df():
     cmd = ["docker", "system", "df", "--format", "json"]
-    lines = sh.Process(cmd).lines
-    lines = ",".join(lines)
-    lines = f"[{lines}]"
-    df = yaml.safe_load(lines)
-    return df
\ No newline at end of file
+    df = list(sh.iter_json_lines(cmd))
+    return df
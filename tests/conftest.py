@@ -0,0 +1,47 @@
+# tests.conftest
+
+
+import subprocess
+import pytest
+
+
+from cs import sh
+
+
+class Processes(object):
+    """Canned outputs of commands, see the `processes` fixture."""
+
+    def __init__(self):
+        self.outputs = {}
+        self.commands = []
+
+    def add(self, command, stdout="", code=0):
+        """Register the output of all commands starting with `command`."""
+        self.outputs[tuple(command)] = (stdout, code)
+
+    def output(self, command):
+        """Return stdout and return code of the longest registered match of `command`."""
+        for n in range(len(command), 0, -1):
+            if tuple(command[:n]) in self.outputs:
+                return self.outputs[tuple(command[:n])]
+        return "", 127
+
+
+@pytest.fixture
+def processes(monkeypatch):
+    """Stub `sh.Process` to return canned outputs instead of running subprocesses.
+
+    Register outputs by `processes.add(command, stdout)`,
+    executed commands are recorded in `processes.commands`.
+    Unregistered commands fail with return code 127.
+    """
+    fake = Processes()
+
+    def run(self):
+        fake.commands.append(self.command)
+        stdout, code = fake.output(self.command)
+        self._update(subprocess.CompletedProcess(self.command, code, stdout, None))
+        return self.is_done
+
+    monkeypatch.setattr(sh.Process, "run", run)
+    return fake
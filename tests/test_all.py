@@ -26,6 +26,27 @@ def test_Config_raises_ValueError():
     #os.environ["COMPOSE_STACK_CONFIG"] = ""
 
 
+def test_Config_reuses_cached_content():
+    Config.invalidate()
+    first = Config("tests/example.yaml")
+    second = Config("tests/example.yaml")
+    assert second.config is first.config
+    Config.invalidate("tests/example.yaml")
+    third = Config("tests/example.yaml")
+    assert third.config == first.config
+
+
+def test_Config_reloads_modified_include(tmp_path):
+    (tmp_path / "compose-stack.yaml").write_text("services: !include services.yaml")
+    services = tmp_path / "services.yaml"
+    services.write_text("systemd: {cron.service: {}}")
+    assert Config(str(tmp_path / "compose-stack.yaml")).get_systemd_units() == ["cron"]
+    services.write_text("systemd: {ssh.service: {}}")
+    stat = services.stat()
+    os.utime(services, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert Config(str(tmp_path / "compose-stack.yaml")).get_systemd_units() == ["ssh"]
+
+
 def test_create_Service_obj():
     srv = Service()
     assert isinstance(srv, Service)
@@ -0,0 +1,25 @@
+# tests.test_cli
+
+
+import pytest
+
+
+from cs.cli import _sniff_subcommand
+
+
+@pytest.mark.parametrize("argv, expected", [
+    ([], None),
+    (["-v"], None),
+    (["ls"], "ls"),
+    (["-vv", "ps", "-a"], "ps"),
+    (["-c", "config.yaml", "config"], "config"),
+    (["--config", "ls", "services"], "services"),
+    (["--conf", "ls", "services"], "services"),
+    (["--config=ls", "services"], "services"),
+    (["-vc", "ls", "services"], "services"),
+    (["-cls", "services"], "services"),
+    (["--version"], "--version"),
+    (["bogus"], "bogus"),
+])
+def test_sniff_subcommand(argv, expected):
+    assert _sniff_subcommand(argv) == expected
@@ -1,6 +1,8 @@
 # tests.test_io
 
 
+import io
+import os
 import json
 import logging
 
@@ -9,7 +11,7 @@ import yaml
 import pytest
 
 
-from cs.io import read_txt, read_json, read_yaml
+from cs.io import read_txt, read_lines, read_json, read_yaml, print_table
 
 
 def test_read_txt_basic(tmp_path):
@@ -101,4 +103,58 @@ def test_read_yaml_logging_info_debug(tmp_path, caplog):
         result = read_yaml(str(file))
         assert result == {"hello": "world"}
         assert "parsing YAML" in caplog.text
-        assert "parsed YAML content" in caplog.text
\ No newline at end of file
+        assert "parsed YAML content" in caplog.text
+
+
+def test_read_lines_splits_on_line_breaks_only(tmp_path):
+    file = tmp_path / "lines.txt"
+    file.write_bytes(b"a\x0cb \nc\n")
+    assert read_lines(str(file)) == ["a\x0cb ", "c"]
+    assert read_lines(str(file), strip=" ") == ["a\x0cb \n", "c\n"]
+    assert read_lines(str(file), strip=None) == ["a\x0cb \n", "c\n"]
+
+
+def test_read_yaml_cached_until_modified(tmp_path):
+    file = tmp_path / "cached.yml"
+    file.write_text("hello: world")
+    first = read_yaml(str(file))
+    assert read_yaml(str(file)) is first
+    file.write_text("hello: again")
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert read_yaml(str(file)) == {"hello": "again"}
+
+
+def test_read_yaml_cached_until_included_file_modified(tmp_path):
+    main = tmp_path / "main.yml"
+    main.write_text("a: !include sub.yml")
+    sub = tmp_path / "sub.yml"
+    sub.write_text("x: 1")
+    first = read_yaml(str(main))
+    assert read_yaml(str(main)) is first
+    sub.write_text("x: 2")
+    stat = sub.stat()
+    os.utime(sub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert read_yaml(str(main)) == {"a": {"x": 2}}
+
+
+def test_print_table_formats_cells():
+    rows = [
+        {"NAME": "web", "PORTS": ["80", "443"], "IMAGE": None},
+        {"NAME": "db", "PORTS": [], "IMAGE": "x" * 50},
+    ]
+    output = io.StringIO()
+    print_table(rows, output=output, output_columns=["NAME", "PORTS", "IMAGE"])
+    assert output.getvalue().splitlines() == [
+        "NAME  PORTS    IMAGE                                       ",
+        "web   80, 443                                              ",
+        "db             " + "x" * 41 + "...",
+    ]
+    assert rows[0]["PORTS"] == ["80", "443"]
+
+
+def test_print_table_csv():
+    rows = [{"NAME": "web", "PORTS": ["80", "443"], "IMAGE": None}]
+    output = io.StringIO()
+    print_table(rows, output=output, output_align=False, output_columns=["NAME", "PORTS"])
+    assert output.getvalue().splitlines() == ["NAME\tPORTS", "web\t80, 443"]
@@ -0,0 +1,38 @@
+# tests.test_object
+
+
+import json
+
+
+import pytest
+
+
+from cs.object import Parsable
+
+
+class Container(Parsable):
+    def reset(self):
+        self.name = None
+        self.values = []
+
+
+def test_get_json():
+    c = Container()
+    c.import_dict({"name": "web", "values": [1, 2]})
+    assert json.loads(c.get_json()) == {"name": "web", "values": [1, 2]}
+    assert json.loads(c.get_json_bytes()) == {"name": "web", "values": [1, 2]}
+
+
+def test_msgpack_roundtrip():
+    pytest.importorskip("msgpack")
+    c = Container()
+    c.import_dict({"name": "web", "values": [1, 2]})
+    d = Container()
+    d.import_msgpack(c.get_msgpack())
+    assert d.get_dict() == {"name": "web", "values": [1, 2]}
+
+
+def test_get_yaml():
+    c = Container()
+    c.import_dict({"name": "web", "values": [1, 2]})
+    assert c.get_yaml() == "name: web\nvalues:\n- 1\n- 2\n"
@@ -0,0 +1,158 @@
+# tests.test_service
+
+
+import json
+
+from cs.config import Config
+from cs.service import Service, Stack, _parse_systemctl_show, _fmt_mem
+
+
+SYSTEMCTL_SHOW = """Id=cron.service
+LoadState=loaded
+FreezerState=running
+ActiveState=active
+SubState=running
+
+Id=ssh.service
+LoadState=loaded
+FreezerState=running
+ActiveState=failed
+SubState=failed
+ExecMainStartTimestamp=Tue 2024-01-02 10:00:00 CET
+StateChangeTimestamp=n/a
+""".splitlines()
+
+
+def test_parse_systemctl_show_multiple_units():
+    units = _parse_systemctl_show(SYSTEMCTL_SHOW)
+    assert [u["Id"] for u in units] == ["cron.service", "ssh.service"]
+
+
+def test_apply_systemctl_dict():
+    s = Service()
+    s._apply_systemctl_dict(_parse_systemctl_show(SYSTEMCTL_SHOW)[1])
+    assert (s.stack, s.name, s.state) == ("systemd", "ssh", "failed")
+    assert (s.started, s.changed) == ("2024-01-02 10:00:00", None)
+
+
+def test_fmt_mem():
+    assert _fmt_mem(str(3 << 29)) == "1.5G"
+    assert _fmt_mem(str(10 << 30)) == "10.0G"
+    assert _fmt_mem("1024") is None
+    assert _fmt_mem("[not set]") is None
+    assert _fmt_mem("18446744073709551615") is None
+    assert _fmt_mem(None) is None
+
+
+DOCKER_INSPECT = {
+    "Id": "0123456789abcdef",
+    "Name": "/web-app-1",
+    "Created": "2024-01-01T10:00:00.123456789Z",
+    "Image": "sha256:fedcba987654",
+    "State": {
+        "Status": "running",
+        "StartedAt": "2024-01-02T10:00:00.123456789Z",
+        "FinishedAt": "0001-01-01T00:00:00Z",
+    },
+    "Config": {
+        "Image": "nginx:latest",
+        "Labels": {
+            "com.docker.compose.project": "web",
+            "com.docker.compose.service": "app",
+            "org.opencontainers.image.version": "1.25",
+        },
+    },
+    "NetworkSettings": {"Ports": {"80/tcp": [{"HostPort": "8080"}], "443/tcp": None}},
+    "HostConfig": {"NetworkMode": "bridge"},
+    "Mounts": [{"Type": "bind"}, {"Type": "volume"}, {"Type": "volume"}],
+}
+
+
+def test_apply_inspect_dict():
+    s = Service()
+    s._apply_inspect_dict(DOCKER_INSPECT)
+    assert (s.type, s.stack, s.name, s.state) == ("compose", "web", "app", "running")
+    assert (s.pid6, s.imageid6, s.imagever) == ("012345", "fedcba", "1.25")
+    assert (s.created, s.started, s.changed) == ("2024-01-01 10:00:00", "2024-01-02 10:00:00", "2024-01-02 10:00:00")
+    assert s.netport == ["8080"]
+    assert s.netmap == ["8080(80/tcp)", "(443/tcp)"]
+    assert s.mounts == "2V 1B"
+
+
+def test_apply_inspect_dict_with_empty_labels():
+    c = dict(DOCKER_INSPECT, Config={"Image": "nginx:latest", "Labels": {
+        "com.docker.compose.project": "",
+        "com.docker.compose.service": "",
+        "org.opencontainers.image.version": "",
+        "org.opencontainers.image.created": "",
+    }})
+    s = Service()
+    s._apply_inspect_dict(c)
+    assert (s.type, s.stack, s.name, s.imagever) == ("dockerd", "dockerd", "web-app-1", "")
+
+
+def test_load_config(tmp_path):
+    (tmp_path / "web.yml").write_text(
+        "services:\n"
+        "  app:\n"
+        "    image: nginx\n"
+        "    ports: ['0.0.0.0:8080:80']\n"
+        "  worker:\n"
+        "    ports: ['9000']\n"
+    )
+    (tmp_path / "compose-stack.yaml").write_text(
+        "services:\n"
+        "  systemd: {cron.service: {}}\n"
+        "  compose:\n"
+        "    web: {path: web.yml}\n"
+        "    old: {path: old.yml, ignored: true}\n"
+    )
+    stack = Stack()
+    stack.load_config(Config(str(tmp_path / "compose-stack.yaml")))
+    rows = [(s.type, s.stack, s.name, s.netport, s.netmap) for s in stack.services]
+    assert rows == [
+        ("systemd", "systemd", "cron", [], []),
+        ("compose", "web", "app", "8080", "8080(80)"),
+        ("compose", "web", "worker", "9000", "9000"),
+    ]
+
+
+def test_Stack_add_merges_equal_services():
+    stack = Stack()
+    configured = Service(wanted=True, stack="web", name="app")
+    assert stack.add(configured)
+    running = Service(stack="web", name="app")
+    running.pid = "0123"
+    assert stack.add(running)
+    assert stack.services == [running]
+    assert running.wanted
+    other = Service(stack="web", name="app")
+    other.pid = "4567"
+    assert other not in stack
+    stack.add(other)
+    assert len(stack) == 2
+    assert stack.get("app", stack="web") is running
+    assert stack.find("app") == [running, other]
+    assert stack.find("app", stack="db") == []
+
+
+def test_load_dockerd_inspects_changed_containers_only(processes):
+    processes.add(["docker", "ps"], "0123456789ab running Up 2 hours\n")
+    processes.add(["docker", "inspect"], json.dumps(DOCKER_INSPECT) + "\n")
+    stack = Stack()
+    stack.load_dockerd()
+    stack.load_dockerd()
+    processes.add(["docker", "ps"], "0123456789ab exited Exited (0) 1 second ago\n")
+    stack.load_dockerd()
+    inspected = [c[4:] for c in processes.commands if c[1] == "inspect"]
+    assert inspected == [["0123456789ab"], ["0123456789ab"]]
+    assert [s.name for s in stack.services] == ["app"]
+
+
+def test_load_systemd(processes):
+    processes.add(["systemctl", "list-units"], "cron.service loaded active running Cron\nssh.service loaded failed failed SSH\n")
+    processes.add(["systemctl", "show"], "\n".join(SYSTEMCTL_SHOW) + "\n")
+    stack = Stack()
+    stack.load_systemd(filter={"Id": ["cron", "ssh"]})
+    assert processes.commands[1][-2:] == ["cron", "ssh"]
+    assert [(s.name, s.state, s.wanted) for s in stack.services] == [("cron", "running", True), ("ssh", "failed", True)]
@@ -0,0 +1,116 @@
+# tests.test_sh
+
+
+import sys
+import logging
+
+from cs import sh
+
+
+def test_Process_json():
+    p = sh.Process(["echo", '[{"Id": "0123", "State": {"Status": "running"}}]'])
+    assert p.is_done
+    assert p.json[0] == {"Id": "0123", "State": {"Status": "running"}}
+
+
+def test_Process_json_without_orjson(monkeypatch):
+    monkeypatch.setattr(sh, "orjson", None)
+    p = sh.Process(["echo", '{"a": [1, null]}'])
+    assert p.json == {"a": [1, None]}
+    assert p.json_lines == [{"a": [1, None]}]
+
+
+def test_Process_json_lines():
+    p = sh.Process(["printf", '{"ID": "a"}\n{"ID": "b"}\n'])
+    assert p.json_lines == [{"ID": "a"}, {"ID": "b"}]
+
+
+def test_Process_run_without_shell():
+    p = sh.Process(["echo", "$HOME", "*"])
+    assert p.stdoutstripped == "$HOME *"
+    p = sh.Process(["cs-no-such-command"])
+    assert p.code == 127
+    assert not p.is_done
+
+
+def test_Process_run_not_executable(tmp_path):
+    file = tmp_path / "script"
+    file.write_text("echo hello")
+    assert sh.Process([str(file)]).code == 126
+    assert sh.Process([str(file / "sub")]).code == 126
+
+
+def test_iter_json_lines():
+    objs = sh.iter_json_lines(["printf", '{"ID": "a"}\\n\\n{"ID": "b"}\\n'])
+    assert next(objs) == {"ID": "a"}
+    assert list(objs) == [{"ID": "b"}]
+    assert list(sh.iter_json_lines(["cs-no-such-command"])) == []
+    assert list(sh.iter_json_lines(["/dev/null"])) == []
+
+
+def test_Process_run_live(capsys, monkeypatch):
+    monkeypatch.delenv("CI", raising=False)
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    p = sh.Process(["printf", "a\\nb\\nc"], live=2)
+    assert p.is_done
+    out = capsys.readouterr().out
+    assert ">> b" in out and ">> c" in out
+
+
+def test_Process_run_live_exec_failure(capsys, monkeypatch, tmp_path):
+    monkeypatch.delenv("CI", raising=False)
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    assert sh.Process(["cs-no-such-command"], live=2).code == 127
+    file = tmp_path / "script"
+    file.write_text("echo hello")
+    assert sh.Process([str(file)], live=2).code == 126
+    assert capsys.readouterr().out == ""
+
+
+def test_Process_run_live_with_much_stderr(capsys, monkeypatch):
+    monkeypatch.delenv("CI", raising=False)
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    p = sh.Process(["sh", "-c", "head -c 5000000 /dev/zero | tr '\\0' 'x' >&2; echo; echo done"], live=2)
+    assert p.is_done
+    assert ">> done" in capsys.readouterr().out
+
+
+def test_Process_run_live_without_terminal(capsys):
+    p = sh.Process(["printf", "a\\nb\\nc"], live=2)
+    assert p.is_done
+    assert p.stdout == "a\nb\nc"
+    assert capsys.readouterr().out == ""
+
+
+def test_Process_run_extended():
+    p = sh.Process(["echo", "a b", "$HOME"])
+    assert p.commandline == "echo 'a b' '$HOME'"
+    assert p.run_extended(piped=True)
+    assert p.stdoutstripped == "a b $HOME"
+    assert p.run_extended(piped=False)
+    assert p.stdoutstripped == "a b $HOME"
+
+
+def test_Process_run_extended_shell_text():
+    p = sh.Process("echo a; echo 'b  c'")
+    assert p.commandline == "echo a; echo 'b  c'"
+    assert p.run_extended(piped=True)
+    assert p.lines == ["a", "b  c"]
+    assert p.run_extended(piped=False)
+    assert p.lines == ["a", "b  c"]
+
+
+def test_Process_stripped_output(caplog):
+    p = sh.Process(["sh", "-c", "echo ' out '; echo ' err ' >&2"])
+    assert (p.stdoutstripped, p.stderrstripped) == ("out", None)
+    caplog.set_level(logging.DEBUG)
+    p = sh.Process(["sh", "-c", "echo ' out '; echo ' err ' >&2"])
+    assert (p.stdoutstripped, p.stderrstripped) == ("out", "err")
+    p = sh.Process(["true"])
+    assert (p.stdoutstripped, p.stderrstripped) == (None, None)
+
+
+def test_Process_lines():
+    p = sh.Process(["printf", "\\n  a\\nb  \\n\\n"])
+    assert p.lines == ["  a", "b  "]
+    assert sh.Process(["true"]).lines == []
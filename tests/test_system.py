@@ -0,0 +1,53 @@
+# tests.test_system
+
+
+import json
+
+from cs import sh
+from cs import system
+
+
+def test_get_docker_volumes_inspects_all_at_once(processes):
+    processes.add(["docker", "volume", "ls"], "data\ncache\n")
+    processes.add(["docker", "volume", "inspect"], json.dumps([
+        {"Name": "data", "Labels": {"com.docker.compose.project": "web"}, "Mountpoint": "/var/lib/docker/volumes/data/_data", "CreatedAt": "2024-01-02T10:00:00Z"},
+        {"Name": "cache", "Labels": None, "CreatedAt": "2024-01-01T10:00:00Z"},
+    ]))
+    volumes = system.get_docker_volumes()
+    assert processes.commands[1] == ["docker", "volume", "inspect", "data", "cache"]
+    assert [(v["ID"], v["COMPOSE_PROJECT"]) for v in volumes] == [("data", "web"), ("cache", None)]
+
+
+def test_get_dockerd_stats(monkeypatch):
+    stats = [
+        {"ID": "0123", "MemUsage": "1.5GiB / 8GiB", "CPUPerc": "0.5%", "BlockIO": "1MB / 2MB", "NetIO": "3kB / 4kB"},
+        {"Name": "no id"},
+    ]
+    monkeypatch.setattr(sh, "iter_json_lines", lambda command: iter(stats))
+    assert system.get_dockerd_stats() == [
+        {"CONTAINER.ID": "0123", "MEM": "1.5", "CPU": "0.5%", "IO.BLK": "1MB / 2MB", "IO.NET": "3kB / 4kB"},
+    ]
+
+
+def test_get_dockerd_df(monkeypatch):
+    df = [{"Type": "Images", "TotalCount": "2", "Size": "1.2GB"}, {"Type": "Local Volumes", "TotalCount": "1", "Size": "0B"}]
+    monkeypatch.setattr(sh, "iter_json_lines", lambda command: iter(df))
+    assert system.get_dockerd_df() == df
+
+
+def test_which():
+    assert system.which("sh").endswith("/sh")
+    assert system.which("cs-no-such-command") is None
+
+
+def test_extract_entry():
+    image = {
+        "Id": "sha256:fedcba987654",
+        "RepoTags": [],
+        "Created": "2024-01-01T10:00:00.123456789Z",
+        "Config": {"Labels": {"org.opencontainers.image.version": "1.25"}},
+    }
+    assert system._extract_entry("fedcba987654", image) == {
+        "ID": "fedcba987654", "TAG": "", "CREATED": "2024-01-01 10:00:00", "VERSION": "1.25",
+    }
+    assert system._extract_entry("0123", {"Config": None})["VERSION"] is None